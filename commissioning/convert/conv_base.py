@@ -2,20 +2,91 @@
 Defines all the common setup and testing.
 """
 
+import contextlib
+import io
 import os
 
 import numpy as N
+from astropy.io import fits as pyfits
 import pysynphot as S
 from pysynphot import etc
 #For thermal classes only
 from pysynphot.observationmode import ObservationMode
 
+try:
+    import fitsio
+    fitsio_imported = True
+except ImportError:
+    fitsio_imported = False
+
 #BUG: find a better way
 HERE = os.getcwd()
 DATADIR = os.path.join(os.path.dirname(HERE),
                        'data')
 
 #TODO: set a specified graph/comp/therm table set in a module setup
+
+@contextlib.contextmanager
+def _in_datadir():
+    """Run the enclosed block from DATADIR, and go back to the previous
+    directory afterwards even if the block raises."""
+    prev=os.getcwd()
+    os.chdir(DATADIR)
+    try:
+        yield
+    finally:
+        os.chdir(prev)
+
+class _FitsRef(object):
+    """The reference column and merged headers of a pysynphot FITS
+    table. Stands in for FileSpectrum/FileBandpass, without reading
+    the wavelengths or converting units."""
+    def __init__(self, fname, colname):
+        self.fheader=dict()
+        if fitsio_imported:
+            with fitsio.FITS(fname) as f:
+                for ext in (0, 1):
+                    hdr=f[ext].read_header()
+                    for key in hdr.keys():
+                        self.fheader[key]=hdr[key]
+                data=f[1][colname][:]
+        else:
+            #Memory-map the table; the column is only paged in when the
+            #tests compare against it.
+            with pyfits.open(fname, memmap=True, lazy_load_hdus=True) as f:
+                for ext in (0, 1):
+                    self.fheader.update(f[ext].header)
+                data=f[1].data.field(colname)
+        setattr(self, colname.lower(), data)
+
+#Several cases share an obsmode, so build each bandpass and
+#ObservationMode only once per run.
+_BP_CACHE = {}
+_OMODE_CACHE = {}
+
+def _get_obsbandpass(obsmode):
+    try:
+        return _BP_CACHE[obsmode]
+    except KeyError:
+        bp=_BP_CACHE[obsmode]=S.ObsBandpass(obsmode)
+        return bp
+
+def _get_obsmode(obsmode):
+    try:
+        return _OMODE_CACHE[obsmode]
+    except KeyError:
+        omode=_OMODE_CACHE[obsmode]=ObservationMode(obsmode)
+        return omode
+
+def _writefits_buffered(obj, fname, **kwargs):
+    """Build the FITS file for obj in memory and write it out in one go,
+    rather than as many small writes (slow on network filesystems)."""
+    hkeys=dict(kwargs.pop('hkeys', None) or {})
+    hkeys.setdefault('filename', (os.path.basename(fname), 'name of file'))
+    buf=io.BytesIO()
+    obj.writefits(buf, hkeys=hkeys, **kwargs)
+    with open(fname, 'wb') as f:
+        f.write(buf.getvalue())
                                        
 class SpecCase(object):
     @classmethod
@@ -39,12 +110,16 @@ class SpecCase(object):
                       thresh=cls.thresh,
                       sigthresh=cls.sigthresh)
         cls.tra=dict()
+        cls._diff_buf=None
+        cls._paths=dict((kind, cls.fname%kind)
+                        for kind in ('thru','spec','obs','therm'))
+        cls._ref_paths=dict((kind, path.replace('.fits','_ref.fits'))
+                            for kind, path in cls._paths.items())
 
 
         if cls.obsmode != "None":
-            cls.bp=S.ObsBandpass(cls.obsmode)
-            cls.bp.writefits(cls.fname%'thru', clobber=True,
-                              trimzero=False)
+            cls.bp=_get_obsbandpass(cls.obsmode)
+            _writefits_buffered(cls.bp, cls._paths['thru'], trimzero=False)
             cls.tra['thru']=cls.bp.name
         else:
             cls.bp = None
@@ -53,11 +128,9 @@ class SpecCase(object):
         if cls.spectrum != "None":
         #All the data lives in a parallel directory, so go sit there
         #in case we need a file
-            os.chdir(DATADIR)
-            cls.sp=etc.parse_spec(cls.spectrum)
-            os.chdir(HERE)
-            cls.sp.writefits(cls.fname%'spec', clobber=True,
-                              trimzero=False)
+            with _in_datadir():
+                cls.sp=etc.parse_spec(cls.spectrum)
+            _writefits_buffered(cls.sp, cls._paths['spec'], trimzero=False)
             cls.tra['sp']=cls.sp.name
         else:
             cls.sp = None
@@ -68,18 +141,39 @@ class SpecCase(object):
             cls.obs.convert('counts')
             x = dict(PSCNTRAT = (cls.obs.countrate(),'countrate'),
                      PSEFFLAM = (cls.obs.efflam(),'efflam'))
-            cls.obs.writefits(cls.fname%'obs', hkeys=x, clobber=True,
-                               trimzero=False)
+            _writefits_buffered(cls.obs, cls._paths['obs'], hkeys=x,
+                                trimzero=False)
             cls.tra['obs']=cls.obs.name
         else:
             cls.obs = None
 
+        cls._refs=dict()
+        cls._load_refs(('thru','THROUGHPUT'),
+                       ('spec','FLUX'),
+                       ('obs','FLUX'))
+
+    @classmethod
+    def _load_refs(cls, *kinds):
+        #Read each reference file once per class, rather than once
+        #in every test that compares against it. Missing files are
+        #only reported by the tests that need them, via _getref.
+        for kind, colname in kinds:
+            refname=cls._ref_paths[kind]
+            if os.path.exists(refname):
+                cls._refs[kind]=_FitsRef(refname, colname)
+
+    def _getref(self, kind):
+        if kind not in self._refs:
+            raise IOError("Reference file not found: %s"%self._ref_paths[kind])
+        return self._refs[kind]
+
 #Helper methods for arrays
-    def count_outliers(self,Nsigma=3):
-        mean=self.adiscrep.mean()
-        std=self.adiscrep.std()
-        outliers=N.where(abs(self.adiscrep) > mean + Nsigma*std)
-        return len(outliers[0])
+    def count_outliers(self,Nsigma=3,mean=None,std=None):
+        if mean is None:
+            mean=self.adiscrep.mean()
+        if std is None:
+            std=self.adiscrep.std()
+        return int(N.count_nonzero(self.absdiscrep > mean + Nsigma*std))
 
     def arraysigtest(self,ref,test):
         #Raise an error if the arrays are not the same size
@@ -88,35 +182,56 @@ class SpecCase(object):
         tt=test[2:-2]
         rr=ref[2:-2]
         #Identify the significant elements
-        tidx=N.where(tt>(self.sigthresh*tt.max()))[0]
-        ridx=N.where(rr>(self.sigthresh*rr.max()))[0]
+        tcut=self.sigthresh*tt.max()
+        rcut=self.sigthresh*rr.max()
+        tmask=tt>tcut
+        rmask=rr>rcut
         #Set a flag if they're not the same set
-        if not (N.alltrue(tidx == ridx)):
+        if not N.array_equal(tmask, rmask):
             self.tra['SigElemDiscrep']=True
-            tidx=ridx
 
         #Now compare only the significant elements.
         #We no longer need to exclude points with zero value, because
         #those points were already excluded as insignificant.
-        self.arraytest(tt[ridx],rr[ridx])
+        self.arraytest(tt[rmask],rr[rmask])
 
     def arraydiff(self,test,ref):
-        idx=N.nonzero(ref)
-        ans=(test[idx]-ref[idx])/ref[idx]
-        return ans
+        #Divide in place and drop the zero-valued reference points
+        #afterwards, rather than gathering three fancy-indexed copies.
+        #The scratch buffer is shared by the tests of a class and only
+        #reallocated when the array size changes.
+        mask=(ref != 0)
+        ans=self._diff_buf
+        if ans is None or ans.shape != ref.shape:
+            ans=N.empty_like(ref, dtype=N.float64)
+            type(self)._diff_buf=ans
+        N.subtract(test, ref, out=ans)
+        N.divide(ans, ref, out=ans, where=mask)
+        return ans[mask]
 
     def arraytest(self,ref,test):
         self.adiscrep=self.arraydiff(test,ref)
-        count=N.where(abs(self.adiscrep)>self.thresh)[0].size
+        self.absdiscrep=abs(self.adiscrep)
+        count=N.count_nonzero(self.absdiscrep>self.thresh)
         try:
             self.tra['Discrepfrac']=float(count)/self.adiscrep.size
+            #Take the mean and std from a sum and a dot product,
+            #and share them with count_outliers. The std uses the
+            #deviations from the mean, so it doesn't cancel when the
+            #discrepancies share a large common offset.
+            n=self.adiscrep.size
+            mean=self.adiscrep.sum()/n
+            dev=self.adiscrep-mean
+            std=N.sqrt(N.dot(dev,dev)/n)
             self.tra['Discrepmin']=self.adiscrep.min()
             self.tra['Discrepmax']=self.adiscrep.max()
-            self.tra['Discrepmean']=self.adiscrep.mean()
-            self.tra['Discrepstd']=self.adiscrep.std()
-            self.tra['Outliers']=self.count_outliers(5)
-            self.failUnless(N.alltrue(abs(self.adiscrep)<self.thresh),
-                            msg="Worst case %f"%abs(self.adiscrep).max())
+            self.tra['Discrepmean']=mean
+            self.tra['Discrepstd']=std
+            self.tra['Outliers']=self.count_outliers(5,mean,std)
+            #max() is NaN if any element is, so this matches all(abs<thresh)
+            worst=self.absdiscrep.max()
+            self.failUnless(worst<self.thresh,
+                            msg="Worst case %f"%worst)
         except ZeroDivisionError:
             self.tra['Discrepfrac']=0.0
             self.tra['Discrepmin']=0.0
@@ -124,10 +239,8 @@ class SpecCase(object):
 
 #Helper method for scalar comparison
     def tcompare(self,rval,tval):
-        if rval != 0:
-            self.discrep=(tval-rval)/rval
-        else:
-            self.discrep=tval-rval
+        #Relative difference, or the absolute one if the reference is zero
+        self.discrep=(tval-rval)/(rval or 1.0)
         self.tra['Discrep']=self.discrep
         self.tra['ref']=rval
         self.tra['tst']=tval
@@ -145,27 +258,27 @@ class SpecCase(object):
 
     def testspec(self):
         if self.sp:
-            self.spref = S.FileSpectrum((self.fname%'spec').replace('.fits','_ref.fits'))
+            self.spref = self._getref('spec')
             self.arraytest(self.spref.flux, self.sp.flux)
 
 class CommCase(SpecCase):
     #In the default case, we also do throughput and observation tests
     def testthru(self):
-            self.bpref = S.FileBandpass((self.fname%'thru').replace('.fits','_ref.fits'))
+            self.bpref = self._getref('thru')
             self.arraytest(self.bpref.throughput, self.bp.throughput)
 
 
     def testobs(self):
-            self.obsref = S.FileSpectrum((self.fname%'obs').replace('.fits','_ref.fits'))
+            self.obsref = self._getref('obs')
             self.arraytest(self.obsref.flux, self.obs.binflux)
 
     def testcntrate(self):
-            self.obsref = S.FileSpectrum((self.fname%'obs').replace('.fits','_ref.fits'))
+            self.obsref = self._getref('obs')
             self.tcompare(self.obsref.fheader['PSCNTRAT'],
                           self.obs.countrate())
 
     def testefflam(self):
-            self.obsref = S.FileSpectrum((self.fname%'obs').replace('.fits','_ref.fits'))
+            self.obsref = self._getref('obs')
             self.tcompare(self.obsref.fheader['PSEFFLAM'],
                           self.obs.efflam())
 
@@ -178,23 +291,24 @@ class ThermCase(CommCase):
         super(CommCase,cls).setup2()
 
         #Then do the thermal stuff
-        cls.omode=ObservationMode(cls.obsmode)
+        cls.omode=_get_obsmode(cls.obsmode)
         cls.thspec=cls.omode.ThermalSpectrum()
         cls.tra['thspec']=cls.thspec.name
         
         cls.thspec.convert('counts')
         cls.thermback=cls.thspec.integrate()*cls.omode.pixscale**2*cls.omode.area
         x = dict(PSTHMBCK = (cls.thermback,'thermback'))
-        cls.thspec.writefits(cls.fname%'therm', clobber=True,
-                              trimzero=False, hkeys=x)
+        _writefits_buffered(cls.thspec, cls._paths['therm'],
+                            trimzero=False, hkeys=x)
+        cls._load_refs(('therm','FLUX'))
         
     def testthspec(self):
-        self.thref = S.FileSpectrum((self.fname%'therm').replace('.fits','_ref.fits'))
+        self.thref = self._getref('therm')
         self.arraytest(self.thref.flux, self.thspec.flux)
                                     
 
     def testhermback(self):
-        self.thref = S.FileSpectrum((self.fname%'therm').replace('.fits','_ref.fits'))
+        self.thref = self._getref('therm')
         self.tcompare(self.thref.fheader['PSTHMBCK'],
                       self.thermback)
         
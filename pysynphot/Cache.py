@@ -3,12 +3,15 @@ read in only once, and then re-used from memory.
 
 This includes the :ref:`reddening laws <pysynphot-extinction>`
 (``pysynphot.locations.RedLaws``)
-and some indices for the `~pysynphot.catalog` model atlases
-(``pysynphot.Cache.CATALOG_CACHE``).
+and some indices and basis spectra for the `~pysynphot.catalog` model
+atlases (``pysynphot.Cache.CATALOG_CACHE`` and
+``pysynphot.Cache.BASIS_CACHE``).
 
 """
 from __future__ import division
 
+import collections
+
 from .locations import RedLaws
 
 # if PYSYN_CDBS is undefined RedLaws will be an empty dictionary
@@ -17,13 +20,45 @@ if 'mwavg' in RedLaws:
     RedLaws[None]=RedLaws['mwavg'] #Establishes default
     RedLaws['gal3']=RedLaws['mwavg'] #Temporary: for syn_pysyn testing
 
+
+class _LRUCache(collections.OrderedDict):
+    """Dictionary that drops its least recently used entry once it
+    holds more than ``maxsize`` entries."""
+
+    def __init__(self, maxsize=128):
+        collections.OrderedDict.__init__(self)
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = collections.OrderedDict.__getitem__(self, key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        collections.OrderedDict.__setitem__(self, key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    def copy(self):
+        new = self.__class__(self.maxsize)
+        for key, value in self.items():
+            collections.OrderedDict.__setitem__(new, key, value)
+        return new
+
+
 CATALOG_CACHE = {}
 
+# Basis spectra read from catalog files, keyed by (filename, column);
+# see catalog.Icat. Also emptied by refs.setref().
+BASIS_CACHE = _LRUCache(512)
+
 
 def reset_catalog_cache():
     """
-    Empty the ``CATALOG_CACHE`` global variable.
+    Empty the ``CATALOG_CACHE`` and ``BASIS_CACHE`` global variables.
     """
-    global CATALOG_CACHE
+    global CATALOG_CACHE, BASIS_CACHE
 
     CATALOG_CACHE.clear()
+    BASIS_CACHE.clear()
@@ -26,7 +26,7 @@ from astropy.io import fits as pyfits
 from . import spectrum
 from . import locations
 
-from .Cache import CATALOG_CACHE
+from .Cache import CATALOG_CACHE, BASIS_CACHE
 
 import pysynphot.exceptions as exceptions
 
@@ -202,12 +202,21 @@ class Icat(spectrum.TabularSourceSpectrum):
 
         filename = locations.KUR_TEMPLATE.replace('*',
                                                   os.path.join(basename,filename))
-        sp = spectrum.TabularSourceSpectrum(filename, fluxname=column)
 
-        totflux = sp.integrate()
-        if not N.isfinite(totflux) or totflux <= 0:
-            raise exceptions.ParameterOutOfBounds(
-                "Parameter '{0}' has no valid data.".format(parlist))
+        # Neighbouring grid points share basis spectra, so each one is
+        # read and validated only once.
+        key = (filename, column)
+        if key in BASIS_CACHE:
+            sp = BASIS_CACHE[key]
+        else:
+            sp = spectrum.TabularSourceSpectrum(filename, fluxname=column)
+
+            totflux = sp.integrate()
+            if not N.isfinite(totflux) or totflux <= 0:
+                raise exceptions.ParameterOutOfBounds(
+                    "Parameter '{0}' has no valid data.".format(parlist))
+
+            BASIS_CACHE[key] = sp
 
         result = []
         for member in parlist:
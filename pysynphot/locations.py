@@ -229,6 +229,38 @@ EXTDIR = 'extinction'
 wavecat = get_data_filename('wavecat.dat')
 
 
+_REMOTE_LISTINGS = {}
+
+
+def _get_remote_listing(path):
+    """Return the file names found in a remote HTTP or FTP directory.
+
+    Listings are cached by URL, so that looking up several tables in
+    the same remote directory (e.g., ``mtab``) costs a single request.
+    Failed requests are not cached, and
+    :func:`~pysynphot.refs.setref` clears the cache when it resets to
+    the default tables.
+
+    """
+    if path in _REMOTE_LISTINGS:
+        return _REMOTE_LISTINGS[path]
+
+    try:
+        if path.lower().startswith('http'):
+            response = request.urlopen(path)  # PY2 has no context manager
+            soup = BeautifulSoup(response, 'html.parser')
+            allfiles = list(set([x.text for x in soup.find_all("a")]))  # Rid symlink
+        else:
+            response = request.urlopen(path).read().decode('utf-8').splitlines()  # noqa
+            # Rid symlink
+            allfiles = list(set([x.split()[-1] for x in response]))
+    except Exception:
+        return []
+
+    _REMOTE_LISTINGS[path] = allfiles
+    return allfiles
+
+
 # Copied over from stsynphot
 def get_latest_file(template, raise_error=False, err_msg=''):
     """Find the filename that appears last in sorted order
@@ -262,24 +294,9 @@ def get_latest_file(template, raise_error=False, err_msg=''):
     path, pattern = os.path.split(irafconvert(template))
     path_lowercase = path.lower()
 
-    # Remote HTTP directory
-    if path_lowercase.startswith('http'):
-        try:
-            response = request.urlopen(path)  # PY2 has no context manager
-            soup = BeautifulSoup(response, 'html.parser')
-            allfiles = list(set([x.text for x in soup.find_all("a")]))  # Rid symlink
-        except Exception:
-            allfiles = []
-
-    # Remote FTP directory
-    elif path_lowercase.startswith('ftp:'):
-        try:
-            response = request.urlopen(path).read().decode('utf-8').splitlines()  # noqa
-        except Exception:
-            allfiles = []
-        else:
-            # Rid symlink
-            allfiles = list(set([x.split()[-1] for x in response]))
+    # Remote directory; listings are fetched once per session
+    if path_lowercase.startswith(('http', 'ftp:')):
+        allfiles = _get_remote_listing(path)
 
     # Local directory
     elif os.path.isdir(path):
@@ -8,7 +8,7 @@ from . import units
 from . import exceptions
 
 
-def ObsBandpass(obstring, graphtable=None, comptable=None, component_dict={}):
+def ObsBandpass(obstring, graphtable=None, comptable=None, component_dict=None):
     """Generate a bandpass object from observation mode.
 
     If the bandpass consists of multiple throughput files
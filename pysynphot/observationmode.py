@@ -29,6 +29,7 @@ from .locations import irafconvert
 from . import planck
 from . import wavetable
 from .tables import CompTable, GraphTable
+from .Cache import _LRUCache
 
 
 #Flag to control verbosity
@@ -41,6 +42,73 @@ wavecat = locations.wavecat
 
 CLEAR = 'clear'
 
+# Precompiled patterns used when parsing obsmode strings and data files
+_BAND_RE = re.compile(r'band\((.*?)\)', re.IGNORECASE)
+_TOKEN_RE = re.compile(r'\S+')
+
+
+# Components shared by ObservationMode instances that are not given
+# their own component_dict.
+_COMPONENT_DICT = _LRUCache(2048)
+
+# Spectral elements already read from throughput and thermal files,
+# shared by all components. Keyed by (filename, interpval) and by
+# filename, respectively.
+_THROUGHPUT_CACHE = _LRUCache(2048)
+_EMISSIVITY_CACHE = _LRUCache(2048)
+
+# Tabulated products of component throughputs, as computed by
+# ObservationMode._tabulateThroughputs(). Keyed by the throughput
+# filenames and parameterized keyword values they were read with.
+_PRODUCT_CACHE = _LRUCache(256)
+
+# Wavelength range of locations.VegaFile; see _getVegaEndpoints().
+_vega_endpoints = None
+
+# Pixel scales from detectors.dat, keyed by "instrument,detector".
+# Read on first use; see _getDetectors().
+_detectors = None
+
+
+def _getVegaEndpoints():
+    global _vega_endpoints
+
+    # Re-read if the user has pointed VegaFile elsewhere.
+    if _vega_endpoints is None or _vega_endpoints[0] != locations.VegaFile:
+        vegasp = spectrum.TabularSourceSpectrum(locations.VegaFile)
+        vegaws = vegasp.GetWaveSet()
+        _vega_endpoints = (locations.VegaFile, vegaws[0], vegaws[-1])
+
+    return _vega_endpoints[1:]
+
+
+def _getDetectors():
+    global _detectors
+
+    if _detectors is None:
+        fname = locations.get_data_filename('detectors.dat')
+        fs = open(fname, mode='r')
+        lines = fs.readlines()
+        fs.close()
+
+        detectors = {}
+        for line in lines:
+            if line.startswith('#') or not line.strip():
+                continue
+            try:
+                tokens = _TOKEN_RE.findall(line)
+                scale = float(tokens[1])
+            except Exception as e:
+                raise ValueError("Error processing %s: %s"%(fname,str(e)))
+            detectors.setdefault(tokens[0], scale)
+
+        # Unmatched obsmodes get the last entry in the file, as they
+        # did when the file was scanned line by line.
+        detectors[None] = scale
+        _detectors = detectors
+
+    return _detectors
+
 
 class BaseObservationMode(object):
     """Class that handles the graph table, common to both optical and
@@ -83,9 +151,10 @@ class BaseObservationMode(object):
     """
     def __init__(self, obsmode, method='HSTGraphTable', graphtable=None):
         #Strip "band()" syntax if present
-        tmatch=re.search(r'band\((.*?)\)',obsmode,re.IGNORECASE)
-        if tmatch:
-            obsmode=tmatch.group(1)
+        if 'band(' in obsmode.lower():
+            tmatch=_BAND_RE.search(obsmode)
+            if tmatch:
+                obsmode=tmatch.group(1)
         self._obsmode = obsmode
 
         if graphtable is None:
@@ -107,15 +176,14 @@ class BaseObservationMode(object):
             self.modes=modes
 
 #        gt = GraphTable(graphtable)
-        if graphtable in refs.GRAPHDICT.keys():
-            gt = refs.GRAPHDICT[graphtable]
-        else:
+        gt = refs.GRAPHDICT.get(graphtable)
+        if gt is None:
             gt = GraphTable(graphtable)
             refs.GRAPHDICT[graphtable] = gt
 
         self.gtname = graphtable
 
-        self.compnames, self.thcompnames = gt.GetComponentsFromGT(self.modes,1)
+        self.compnames, self.thcompnames = self._getComponentNames(gt)
 
         if hasattr(gt, 'primary_area'):
             self.primary_area = gt.primary_area
@@ -146,17 +214,21 @@ class BaseObservationMode(object):
     def __len__(self):
         return len(self.components)
 
+    def _getComponentNames(self, gt):
+        # Graph table look-ups are re-used for the same modes and table.
+        key = (tuple(self.modes), self.gtname)
+
+        if key not in refs.OBSMODEDICT:
+            refs.OBSMODEDICT[key] = gt.GetComponentsFromGT(self.modes,1)
+        compnames, thcompnames = refs.OBSMODEDICT[key]
+
+        return list(compnames), list(thcompnames)
+
     def _getFileNames(self, comptable, compnames):
         files = []
         for compname in compnames:
             if compname not in [None, '', CLEAR]:
-                index = N.where(comptable.compnames == compname)
-                try:
-                    iraffilename = comptable.filenames[index[0][0]]
-                    filename = irafconvert(iraffilename)
-                    files.append(filename.lstrip())
-                except IndexError:
-                    raise IndexError("Can't find %s in comptable %s"%(compname,comptable.name))
+                files.append(comptable.getpath(compname))
             else:
                 files.append(CLEAR)
 
@@ -203,51 +275,34 @@ class BaseObservationMode(object):
     def _computeBandwave(self, coeff):
         (a,b,c,nwave) = self._computeQuadraticCoefficients(coeff)
 
-        result = N.zeros(shape=[nwave,], dtype=N.float64)
+        i = N.arange(nwave, dtype=N.float64)
 
-        for i in range(nwave):
-            result[i] = ((a * i) + b) * i + c
-
-        return result
+        return ((a * i) + b) * i + c
 
     def _computeQuadraticCoefficients(self, coeff):
 
-        coefficients = (coeff[1:][:-1]).split(',')
+        coefficients = tuple(map(float, coeff[1:-1].split(',')))
 
-        c0 = float(coefficients[0])
-        c1 = float(coefficients[1])
-        c2 = (c1 - c0) / 1999.0    # arbitraily copied from synphot....
-        #In synphot.countrate/calcstep.x, it was NSPEC-1, where
-        #NSPEC was hardcoded to 2000 as the number of bins into
-        #which the wavelength set should be divided by default
-        c3 = c2
+        c0, c1 = coefficients[:2]
         if len(coefficients) > 2:
-            c2 = float(coefficients[2])
-            c3 = c2
-        if len(coefficients) > 3:
-            c3 = float(coefficients[3])
+            c2 = coefficients[2]
+        else:
+            c2 = (c1 - c0) / 1999.0    # arbitraily copied from synphot....
+            #In synphot.countrate/calcstep.x, it was NSPEC-1, where
+            #NSPEC was hardcoded to 2000 as the number of bins into
+            #which the wavelength set should be divided by default
+        c3 = coefficients[3] if len(coefficients) > 3 else c2
 
         nwave = int(2.0 * (c1 - c0) / (c3 + c2)) + 1
 
-        c = c0
-        b = c2
         a = (c3 * c3 - c2 * c2) / (4.0 * (c1 - c0))
 
-        return (a,b,c,nwave)
+        return (a,c2,c0,nwave)
 
     def _getBandwaveFomFile(self, filename):
         name = irafconvert(filename)
 
-        fs = open(name, mode='r')
-        lines = fs.readlines()
-        fs.close()
-
-        tokens = []
-        for line in lines:
-            if not line.startswith('#'):
-                tokens.append(line)
-
-        return N.float64(tokens)
+        return N.loadtxt(name, comments='#', dtype=N.float64, ndmin=1)
 
 
 class ObservationMode(BaseObservationMode):
@@ -261,8 +316,10 @@ class ObservationMode(BaseObservationMode):
     comptable : str or `None`
         Component table name. If `None`, it is taken from `~pysynphot.refs`.
 
-    component_dict : dict
+    component_dict : dict or `None`
         Maps component filename to corresponding component object.
+        If `None`, a module-wide dictionary, limited to the 2048 most
+        recently used components, is shared with other instances.
 
     Attributes
     ----------
@@ -297,32 +354,47 @@ class ObservationMode(BaseObservationMode):
 
     """
     def __init__(self, obsmode, method='HSTGraphTable',graphtable=None,
-                 comptable=None, component_dict = {}):
+                 comptable=None, component_dict=None):
 
         if graphtable is None:
             graphtable = refs.GRAPHTABLE
         if comptable is None:
             comptable = refs.COMPTABLE
+        if component_dict is None:
+            component_dict = _COMPONENT_DICT
 
         BaseObservationMode.__init__(self, obsmode, method, graphtable)
 
-#        ct = CompTable(comptable)
-        if comptable in refs.COMPDICT.keys():
-            ct = refs.COMPDICT[comptable]
-        else:
-            ct = CompTable(comptable)
-            refs.COMPDICT[comptable] = ct
-
         self.ctname = comptable
 
-        self._throughput_filenames = self._getFileNames(ct, self.compnames)
+        self._throughput_filenames = self._getThroughputFileNames()
 
         self.components = self._getOpticalComponents(self._throughput_filenames,
                                                       component_dict)
 
+    def _getThroughputFileNames(self):
+        # Component table look-ups are re-used for the same modes and
+        # tables.
+        key = (tuple(self.modes), self.gtname, self.ctname)
+
+        if key not in refs.OBSMODEDICT:
+#            ct = CompTable(comptable)
+            ct = refs.COMPDICT.get(self.ctname)
+            if ct is None:
+                ct = CompTable(self.ctname)
+                refs.COMPDICT[self.ctname] = ct
+
+            refs.OBSMODEDICT[key] = self._getFileNames(ct, self.compnames)
+
+        return list(refs.OBSMODEDICT[key])
+
     def _getOpticalComponents(self, throughput_filenames, component_dict):
         components = []
         for throughput_name in throughput_filenames:
+            # Would only make an empty component
+            if throughput_name == CLEAR:
+                continue
+
             if throughput_name.endswith('#]'):
                 barename,parkey=throughput_name.split('[')
                 parkey=parkey[:-2]
@@ -357,11 +429,13 @@ class ObservationMode(BaseObservationMode):
         """
         sensitivity = spectrum.TabularSpectralElement()
 
-        product = self._multiplyThroughputs()
+        product = self._tabulateThroughputs(0)
 
+        # The product table is not shared, so scale it in place.
         sensitivity._wavetable = product.GetWaveSet()
-        sensitivity._throughputtable = product(sensitivity._wavetable) * \
-                                      sensitivity._wavetable * self._constant
+        sensitivity._throughputtable = product._throughputtable
+        sensitivity._throughputtable *= sensitivity._wavetable
+        sensitivity._throughputtable *= self._constant
 
         return sensitivity
 
@@ -375,13 +449,7 @@ class ObservationMode(BaseObservationMode):
 
         """
         try:
-            throughput = spectrum.TabularSpectralElement()
-
-            product = self._multiplyThroughputs(0)
-
-            throughput._wavetable = product.GetWaveSet()
-            throughput._throughputtable = product(throughput._wavetable)
-            throughput.waveunits = product.waveunits
+            throughput = self._tabulateThroughputs(0)
             throughput.name='*'.join([str(x) for x in self.components])
 
 ##            throughput = throughput.resample(spectrum._default_waveset)
@@ -392,12 +460,43 @@ class ObservationMode(BaseObservationMode):
             return None
 
 
-    def _multiplyThroughputs(self, index):
-        product = self.components[index].throughput
-        if len(self.components) > index:
+    def _tabulateThroughputs(self, index):
+        ''' Multiply the throughputs of the components, starting at
+        the given index. Each throughput is sampled once on the merged
+        wavelength set and the arrays are multiplied directly, instead
+        of going through a chain of composite spectral elements.
+        '''
+        key = (tuple(self._throughput_filenames),
+               tuple(sorted(self.pardict.items())), index)
+        if key in _PRODUCT_CACHE:
+            waveunits, wave, table = _PRODUCT_CACHE[key]
+        else:
+            throughputs = [self.components[index].throughput]
             for component in self.components[index+1:]:
-                if component.throughput != None:
-                    product = product * component.throughput
+                if component.throughput is not None:
+                    throughputs.append(component.throughput)
+
+            waveunits = throughputs[0].waveunits
+            wave = throughputs[0].GetWaveSet()
+            for thru in throughputs[1:]:
+                if thru.waveunits.name != waveunits.name:
+                    msg = ("Components have different waveunits (%s and %s)" %
+                           (waveunits, thru.waveunits))
+                    raise NotImplementedError(msg)
+                wave = spectrum.MergeWaveSets(wave, thru.GetWaveSet())
+
+            table = throughputs[0](wave)
+            for thru in throughputs[1:]:
+                table *= thru(wave)
+
+            _PRODUCT_CACHE[key] = (waveunits, wave, table)
+
+        # Callers may modify the product in place (see Sensitivity).
+        product = spectrum.TabularSpectralElement()
+        product._wavetable = wave.copy()
+        product._throughputtable = table.copy()
+        product.waveunits = waveunits
+
         return product
 
 
@@ -447,9 +546,8 @@ class _ThermalObservationMode(BaseObservationMode):
             raise NotImplementedError("No thermal support provided for %s"%obsmode)
 
 #        ct = CompTable(comptable)
-        if comptable in refs.COMPDICT.keys():
-            ct = refs.COMPDICT[comptable]
-        else:
+        ct = refs.COMPDICT.get(comptable)
+        if ct is None:
             ct = CompTable(comptable)
             refs.COMPDICT[comptable] = ct
 
@@ -458,9 +556,8 @@ class _ThermalObservationMode(BaseObservationMode):
         throughput_filenames = self._getFileNames(ct, self.compnames)
 
 #        thct = CompTable(thermtable)
-        if thermtable in refs.THERMDICT.keys():
-            thct = refs.THERMDICT[thermtable]
-        else:
+        thct = refs.THERMDICT.get(thermtable)
+        if thct is None:
             thct = CompTable(thermtable)
             refs.THERMDICT[thermtable] = thct
 
@@ -478,27 +575,19 @@ class _ThermalObservationMode(BaseObservationMode):
         obsmode = self._obsmode.split(',')
         obsmode = str(obsmode[0]) + ',' + str(obsmode[1])
 
-        fname= locations.get_data_filename('detectors.dat')
-        fs = open(fname,mode='r')
-        lines = fs.readlines()
-        fs.close()
+        detectors = _getDetectors()
 
-        regx = re.compile(r'\S+', re.IGNORECASE)
-        for line in lines:
-            try:
-                tokens = regx.findall(line)
-                if tokens[0] == obsmode:
-                    break
-            except Exception as e:
-                raise ValueError("Error processing %s: %s"%(fname,str(e)))
-
-        return float(tokens[1])
+        return detectors.get(obsmode, detectors[None])
 
     def _getThermalComponents(self, throughput_filenames, thermal_filenames):
         components = []
         for i in range(len(throughput_filenames)):
             throughput_name = throughput_filenames[i]
             thermal_name = thermal_filenames[i]
+            # Would only make an empty component
+            if throughput_name == CLEAR and thermal_name == CLEAR:
+                continue
+
             if throughput_name.endswith('#]'):
                 barename,parkey=throughput_name.split('[')
                 parkey=parkey[:-2]
@@ -512,17 +601,6 @@ class _ThermalObservationMode(BaseObservationMode):
 
         return components
 
-    def _multiplyThroughputs(self):
-        ''' Overrides base class in order to deal with opaque components.
-        '''
-        index = 0
-        for component in self.components:
-            if component.throughput != None:
-                break
-            index += 1
-
-        return BaseObservationMode._multiplyThroughputs(self, index)
-
     def _getSpectrum(self):
         wave=self._getWavesetIntersection()
         sp = spectrum.ArraySourceSpectrum(wave=wave,
@@ -537,13 +615,25 @@ class _ThermalObservationMode(BaseObservationMode):
 
         for component in self.components:
             # transmissive section
-            if component.throughput != None:
-                sp = sp * component.throughput
+            if component.throughput is not None:
+                if component.throughput._throughputtable.any():
+                    sp = sp * component.throughput
+                else:
+                    # Opaque: nothing upstream gets through, so start
+                    # again from zero on the same wavelength set rather
+                    # than keep evaluating the upstream components.
+                    wave = spectrum.MergeWaveSets(
+                        sp.GetWaveSet(), component.throughput.GetWaveSet())
+                    sp = spectrum.ArraySourceSpectrum(wave=wave,
+                               flux=N.zeros(shape=wave.shape,dtype=N.float64),
+                               waveunits='angstrom',
+                               fluxunits='photlam',
+                               name="%s %s"%(self.name,'ThermalSpectrum'))
 
  #               sp = spectrum.trimSpectrum(sp, minw, maxw)
 
             # thermal section
-            if component.emissivity != None:
+            if component.emissivity is not None:
                 bb = self._bb(sp.GetWaveSet(), component.emissivity.temperature)
 
                 sp_comp = component.emissivity.beamFillFactor * bb * \
@@ -560,7 +650,7 @@ class _ThermalObservationMode(BaseObservationMode):
         maxw = refs._default_waveset[-1]
 
         for component in self.components[1:]:
-            if component.emissivity != None:
+            if component.emissivity is not None:
                 wave = component.emissivity.GetWaveSet()
 
                 minw = max(minw, wave[0])
@@ -568,33 +658,26 @@ class _ThermalObservationMode(BaseObservationMode):
 
         result = self._mergeEmissivityWavesets()
 
-        result = N.compress(result > minw, result)
-        result = N.compress(result < maxw, result)
-
         # intersection with vega spectrum (why???)
-        vegasp = spectrum.TabularSourceSpectrum(locations.VegaFile)
-        vegaws = vegasp.GetWaveSet()
-        result = N.compress(result > vegaws[0], result)
-        result = N.compress(result < vegaws[-1], result)
+        vegamin, vegamax = _getVegaEndpoints()
 
-        return result
+        mask = ((result > minw) & (result < maxw) &
+                (result > vegamin) & (result < vegamax))
+
+        return result[mask]
 
     def _mergeEmissivityWavesets(self):
-        index = 1
+        wavesets = [component.emissivity.GetWaveSet()
+                    for component in self.components
+                    if component.emissivity is not None]
 
-        for component in self.components:
-            emissivity = component.emissivity
-            if emissivity == None:
-                index = index + 1
-            else:
-                result = emissivity.GetWaveSet()
-                break;
+        if len(wavesets) == 1:
+            return wavesets[0]
 
-        for component in self.components[index:]:
-            if component.emissivity != None:
-                result = spectrum.MergeWaveSets(result, \
-                         component.emissivity.GetWaveSet())
-        return result
+        # MergeWaveSets takes the union of its two inputs, so this merges
+        # all the wavesets with a single sort instead of one per component.
+        return spectrum.MergeWaveSets(N.concatenate(wavesets[:-1]),
+                                      wavesets[-1])
 
     def _bb(self, wave, temperature):
         sp = spectrum.ArraySourceSpectrum(wave=wave,
@@ -618,12 +701,15 @@ class _Component(object):
 
     def _buildThroughput(self, name, interpval):
         if name != CLEAR:
-            if interpval is None:
-                self._empty = False
-                return spectrum.TabularSpectralElement(name)
-            else:
-                self._empty = False
-                return spectrum.InterpolatedSpectralElement(name, interpval)
+            self._empty = False
+            key = (name, interpval)
+            if key not in _THROUGHPUT_CACHE:
+                if interpval is None:
+                    thru = spectrum.TabularSpectralElement(name)
+                else:
+                    thru = spectrum.InterpolatedSpectralElement(name, interpval)
+                _THROUGHPUT_CACHE[key] = thru
+            return _THROUGHPUT_CACHE[key]
         else:
             return None
 
@@ -643,6 +729,9 @@ class _ThermalComponent(_Component):
 
         if thermal_name != CLEAR:
             self._empty = False
-            self.emissivity = spectrum.ThermalSpectralElement(thermal_name)
+            if thermal_name not in _EMISSIVITY_CACHE:
+                _EMISSIVITY_CACHE[thermal_name] = \
+                    spectrum.ThermalSpectralElement(thermal_name)
+            self.emissivity = _EMISSIVITY_CACHE[thermal_name]
         else:
             self.emissivity = None
@@ -93,7 +93,7 @@ def bbfunc(wave, temperature):
 
     mask2 = N.where(x < UPPER, 1, 0)
     mask = mask1 * mask2
-    factor = N.where(mask == 1, 1.0 / (N.exp(x) - 1.0), factor)
+    factor = N.where(mask == 1, 1.0 / N.expm1(x), factor)
 
     x = x * temperature / 1.95722E5
     x = factor * x * x * x
@@ -123,18 +123,19 @@ def llam_SI(wave, temperature):
         Blackbody radiation in SI units.
 
     """
+    wave = N.asarray(wave, dtype=N.float64)
     exponent = C2 / (wave * temperature)
+    wave5 = wave ** -5.0
 
     result = N.zeros(wave.shape, dtype=N.float64)
 
-    mask1 = N.where(exponent <= LOWER, 0, 1)
-    result = N.where(mask1==0, (2.0 * C1 * (wave**-5.0)) / (exponent * (exponent + 2.0)), result)
+    # Same branches as synphot's bbfunc, but each one is only evaluated
+    # where it applies; beyond UPPER the result stays zero.
+    mask1 = exponent <= LOWER
+    result[mask1] = (2.0 * C1 * wave5[mask1]) / (exponent[mask1] * (exponent[mask1] + 2.0))
 
-    mask2 = N.where(exponent <= UPPER, 1, 0)
-    mask = mask1 * mask2
-    exponent = N.where(mask2==1, exponent, UPPER)
-    expfactor = N.exp(exponent)
-    result = N.where(mask==1, (C1 * (wave**-5.0) / (expfactor - 1.0)), result)
+    mask = ~mask1 & (exponent <= UPPER)
+    result[mask] = C1 * wave5[mask] / N.expm1(exponent[mask])
 
     return result
 
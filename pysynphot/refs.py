@@ -18,6 +18,8 @@ a given bandpass:
 * ``pysynphot.refs.COMPDICT``
 * ``pysynphot.refs.THERMTABLE``
 * ``pysynphot.refs.THERMDICT``
+* ``pysynphot.refs.OBSMODEDICT`` - Component names and throughput files
+  already looked up for a given observation mode and set of tables.
 
 """
 from __future__ import print_function
@@ -27,7 +29,8 @@ import warnings
 
 import numpy as np
 
-from .locations import irafconvert, _refTable
+from .locations import irafconvert, _refTable, _REMOTE_LISTINGS
+from .Cache import BASIS_CACHE
 
 _default_waveset = None
 _default_waveset_str = None
@@ -39,6 +42,7 @@ COMPTABLE = ''
 COMPDICT = {}
 THERMTABLE = ''
 THERMDICT = {}
+OBSMODEDICT = {}
 
 PRIMARY_AREA = 45238.93416  # cm^2 - default to HST mirror
 
@@ -106,6 +110,10 @@ def set_default_waveset(minwave=500, maxwave=26000, num=10000,
 def _set_default_refdata():
     """Default refdata set on import."""
     global GRAPHTABLE, COMPTABLE, THERMTABLE, PRIMARY_AREA
+    # Fetch remote listings again, so that a reset picks up tables
+    # published since the last one.
+    _REMOTE_LISTINGS.clear()
+
     # Component tables are defined here.
 
     try:
@@ -165,11 +173,13 @@ def setref(graphtable=None, comptable=None, thermtable=None,
         Invalid ``waveset`` parameters.
 
     """
-    global GRAPHTABLE, COMPTABLE, THERMTABLE, PRIMARY_AREA, GRAPHDICT, COMPDICT, THERMDICT
+    global GRAPHTABLE, COMPTABLE, THERMTABLE, PRIMARY_AREA, GRAPHDICT, COMPDICT, THERMDICT, OBSMODEDICT
 
     GRAPHDICT = {}
     COMPDICT = {}
     THERMDICT = {}
+    OBSMODEDICT = {}
+    BASIS_CACHE.clear()
 
     #Check for all None, which means reset
     kwds=set([graphtable,comptable,thermtable,area,waveset])
@@ -190,6 +190,7 @@ class GenericParser(object):
                 
                 if self.ruleschanged:
                         self.makeFIRST()
+                        self.ruleschanged = 0
 
                 for i in range(len(tokens)):
                         states[i+1] = []
@@ -79,7 +79,14 @@ def MergeWaveSets(waveset1, waveset2):
     elif waveset1 is None and waveset2 is None:
         MergedWaveSet = None
     else:
-        MergedWaveSet = N.union1d(waveset1, waveset2)
+        if (N.shape(waveset1) == N.shape(waveset2) and
+                N.result_type(waveset1) == N.result_type(waveset2) and
+                N.array_equal(waveset1, waveset2)):
+            # Common for composites of analytic spectra, which all sample
+            # the default wavelength set; no need to sort both copies.
+            MergedWaveSet = N.unique(waveset1)
+        else:
+            MergedWaveSet = N.union1d(waveset1, waveset2)
 
         # The merged wave sets may sometimes contain numbers which are nearly
         # equal but differ at levels as small as 1e-14. Having values this
@@ -123,11 +130,9 @@ def trimSpectrum(sp, minw, maxw):
     wave = sp.GetWaveSet()
     flux = sp(wave)
 
-    new_wave = N.compress(wave >= minw, wave)
-    new_flux = N.compress(wave >= minw, flux)
-
-    new_wave = N.compress(new_wave <= maxw, new_wave)
-    new_flux = N.compress(new_wave <= maxw, new_flux)
+    mask = (wave >= minw) & (wave <= maxw)
+    new_wave = wave[mask]
+    new_flux = flux[mask]
 
     result = TabularSourceSpectrum()
 
@@ -140,6 +145,94 @@ def trimSpectrum(sp, minw, maxw):
     return result
 
 
+def _evaluateChain(composite, wavelength, ufunc):
+    """Evaluate a composite spectrum or bandpass at ``wavelength``.
+
+    Left-nested chains of the same operation (``a * b * c * ...``), as
+    built by the parser and by chained operators, are unrolled so that
+    every further term is applied in place to one result array instead
+    of allocating a new temporary per level. Terms are combined in the
+    same order as the nested evaluation would.
+
+    """
+    cls = type(composite)
+    operation = getattr(composite, 'operation', 'multiply')
+
+    terms = [composite.component2]
+    left = composite.component1
+    while (type(left).__call__ is cls.__call__ and
+           getattr(left, 'operation', 'multiply') == operation):
+        terms.append(left.component2)
+        left = left.component1
+
+    result = ufunc(left(wavelength), terms.pop()(wavelength))
+    while terms:
+        value = terms.pop()(wavelength)
+        if (isinstance(result, N.ndarray) and
+                result.dtype == N.result_type(result, value)):
+            ufunc(result, value, out=result)
+        else:
+            result = ufunc(result, value)
+    return result
+
+
+def _nativeColumn(column):
+    """Return a copy of a FITS table column in native byte order.
+
+    FITS data are big-endian, and NumPy arithmetic on non-native arrays is
+    noticeably slower. The dtype precision is left as read.
+
+    """
+    return column.astype(column.dtype.newbyteorder('='))
+
+
+def _interpTable(newwave, wavetable, table):
+    """Interpolate ``table``, tabulated on ``wavetable``, at ``newwave``.
+
+    Either wavelength array may be ascending or descending; the result
+    follows the order of ``newwave``. This is the interpolation used by
+    :meth:`TabularSourceSpectrum.resample` and
+    :meth:`TabularSpectralElement.resample`.
+
+    """
+    # Check whether the input wavetab is in descending order
+    if newwave[0] < newwave[-1]:
+        newasc = True
+    else:
+        newwave = newwave[::-1]
+        newasc = False
+
+    # Use numpy interpolation function
+    if wavetable[0] < wavetable[-1]:
+        oldasc = True
+        ans = N.interp(newwave, wavetable, table)
+    else:
+        oldasc = False
+        rev = N.interp(newwave, wavetable[::-1], table[::-1])
+        ans = rev[::-1]
+
+    # If the new and old waveset don't have the same parity,
+    # the answer has to be flipped again
+    if (newasc != oldasc):
+        ans = ans[::-1]
+
+    return ans
+
+
+def _isValidWaveset(wave):
+    """Return `True` if ``wave`` is a 1-D array that would pass
+    :meth:`Integrator.validate_wavetable`, i.e., positive and strictly
+    monotonic. This is a cheap check that avoids sorting.
+
+    """
+    if not isinstance(wave, N.ndarray) or wave.ndim != 1:
+        return False
+
+    delta = N.diff(wave)
+    return (not N.any(wave <= 0) and
+            (N.all(delta > 0) or N.all(delta < 0)))
+
+
 class Integrator(object):
     """Integrator engine, which is the base class for
     `SourceSpectrum` and `SpectralElement`.
@@ -165,9 +258,8 @@ class Integrator(object):
         """
         npoints = x.size
         if npoints > 0:
-            indices = N.arange(npoints)[:-1]
-            deltas = x[indices+1] - x[indices]
-            integrand = 0.5*(y[indices+1] + y[indices])*deltas
+            deltas = x[1:] - x[:-1]
+            integrand = 0.5*(y[1:] + y[:-1])*deltas
             sum = integrand.sum()
             if x[-1] < x[0]:
                 sum *= -1.0
@@ -419,8 +511,10 @@ class SourceSpectrum(Integrator):
 
         Parameters
         ----------
-        filename : str
-            Output filename.
+        filename : str or file-like
+            Output filename, or a writable binary file object. A file
+            object's ``name`` attribute, if any, is used for ``FILENAME``
+            (which ``hkeys`` may override).
 
         clobber : bool
             Overwrite existing file. Default is `True`.
@@ -453,7 +547,7 @@ class SourceSpectrum(Integrator):
         _precision = precision.lower()[0]
         pcodes = {'d':'D','s':'E','f':'E'}
 
-        if clobber:
+        if clobber and isinstance(filename, str):
             try:
                 os.remove(filename)
             except OSError:
@@ -506,7 +600,11 @@ class SourceSpectrum(Integrator):
 
         # User-provided keys are written to the primary header
         # so are filename and origin
-        bkeys = dict(filename=(os.path.basename(filename), 'name of file'),
+        if isinstance(filename, str):
+            basename = os.path.basename(filename)
+        else:
+            basename = os.path.basename(getattr(filename, 'name', ''))
+        bkeys = dict(filename=(basename, 'name of file'),
                      origin=('pysynphot', 'Version (%s, %s)' %
                              (__version__, __svn_revision__)))
         # User-values if present may override default values
@@ -685,9 +783,16 @@ class SourceSpectrum(Integrator):
         fluxunits = self.fluxunits
         self.convert('angstrom')
         self.convert('photlam')
-        newwave = self.wave.astype(N.float64) * (1.0 + z)
+
+        # Evaluate the spectrum once; self.wave and self.flux would each
+        # call getArrays().
+        wave, flux = self.getArrays()
+        newwave = wave.astype(N.float64)
+        if z != 0:
+            newwave *= (1.0 + z)
+
         copy = ArraySourceSpectrum(wave=newwave,
-                                   flux=self.flux,
+                                   flux=flux,
                                    waveunits=self.waveunits,
                                    fluxunits=self.fluxunits,
                                    name="%s at z=%g" % (self.name, z))
@@ -880,10 +985,10 @@ class CompositeSourceSpectrum(SourceSpectrum):
         to the individual objects.
         """
         if self.operation == 'add':
-            return self.component1(wavelength) + self.component2(wavelength)
+            return _evaluateChain(self, wavelength, N.add)
 
         if self.operation == 'multiply':
-            return self.component1(wavelength) * self.component2(wavelength)
+            return _evaluateChain(self, wavelength, N.multiply)
 
     def __iter__(self):
         """Allow iteration over each component."""
@@ -1016,10 +1121,10 @@ class TabularSourceSpectrum(SourceSpectrum):
 
         # pyfits cannot close the file on .close() if there are still
         # references to mmapped data
-        self._wavetable = fs[1].data.field('wavelength').copy()
+        self._wavetable = _nativeColumn(fs[1].data.field('wavelength'))
         if fluxname is None:
             fluxname = 'flux'
-        self._fluxtable = fs[1].data.field(fluxname).copy()
+        self._fluxtable = _nativeColumn(fs[1].data.field(fluxname))
 
         self.waveunits = units.Units(fs[1].header['tunit1'].lower())
         self.fluxunits = units.Units(fs[1].header['tunit2'].lower())
@@ -1050,6 +1155,11 @@ class TabularSourceSpectrum(SourceSpectrum):
                           wavelengths + delta])
             tmp = self.resample(ww)
             return tmp._fluxtable[1]
+        elif _isValidWaveset(wavelengths):
+            # Same values as resample() (fluxes are kept in photlam),
+            # without building and validating a new spectrum.
+            ans = _interpTable(wavelengths, self._wavetable, self._fluxtable)
+            return N.ascontiguousarray(ans)
         else:
             return self.resample(wavelengths)._fluxtable
 
@@ -1108,28 +1218,7 @@ class TabularSourceSpectrum(SourceSpectrum):
             Resampled spectrum.
 
         """
-        # Check whether the input wavetab is in descending order
-        if resampledWaveTab[0] < resampledWaveTab[-1]:
-            newwave = resampledWaveTab
-            newasc = True
-        else:
-            newwave = resampledWaveTab[::-1]
-            newasc = False
-
-        # Use numpy interpolation function
-        if self._wavetable[0] < self._wavetable[-1]:
-            oldasc = True
-            ans = N.interp(newwave, self._wavetable, self._fluxtable)
-        else:
-            oldasc = False
-            rev = N.interp(newwave, self._wavetable[::-1],
-                           self._fluxtable[::-1])
-            ans = rev[::-1]
-
-        # If the new and old waveset don't have the same parity,
-        # the answer has to be flipped again
-        if (newasc != oldasc):
-            ans = ans[::-1]
+        ans = _interpTable(resampledWaveTab, self._wavetable, self._fluxtable)
 
         # Finally, make the new object
         # NB: these manipulations were done using the internal
@@ -1316,10 +1405,10 @@ class FileSourceSpectrum(TabularSourceSpectrum):
 
         # pyfits cannot close the file on .close() if there are still
         # references to mmapped data
-        self._wavetable = fs[1].data.field('wavelength').copy()
+        self._wavetable = _nativeColumn(fs[1].data.field('wavelength'))
         if fluxname is None:
             fluxname = 'flux'
-        self._fluxtable = fs[1].data.field(fluxname).copy()
+        self._fluxtable = _nativeColumn(fs[1].data.field(fluxname))
         self.waveunits = units.Units(fs[1].header['tunit1'].lower())
         self.fluxunits = units.Units(fs[1].header['tunit2'].lower())
 
@@ -1469,8 +1558,16 @@ class GaussianSource(AnalyticSpectrum):
             wavelength, self._input_wave_units.name)
 
         # calculate flux
-        flux = (self.factor *
-                N.exp(-0.5 * ((wave - self.center) / self.sigma) ** 2))
+        if isinstance(wave, N.ndarray):
+            # exp() underflows to exactly zero beyond ~38.6 sigma, so the
+            # line is only evaluated on its support; NaNs still propagate.
+            x = (wave - self.center) / self.sigma
+            support = ~(N.abs(x) >= 39.0)
+            flux = N.zeros_like(x)
+            flux[support] = self.factor * N.exp(-0.5 * x[support] ** 2)
+        else:
+            flux = (self.factor *
+                    N.exp(-0.5 * ((wave - self.center) / self.sigma) ** 2))
 
         if hasattr(self, 'primary_area'):
             area = self.primary_area
@@ -2165,6 +2262,11 @@ class SpectralElement(Integrator):
                           wavelengths + delta])
             tmp = self.resample(ww)
             return tmp._throughputtable[1]
+        elif _isValidWaveset(wavelengths):
+            # Same values as resample(), without building and
+            # validating a new spectral element.
+            ans = _interpTable(wavelengths, self._wavetable, self._throughputtable)
+            return N.ascontiguousarray(ans)
         else:
             return self.resample(wavelengths)._throughputtable
 
@@ -2260,8 +2362,10 @@ class SpectralElement(Integrator):
 
         Parameters
         ----------
-        filename : str
-            Output filename.
+        filename : str or file-like
+            Output filename, or a writable binary file object. A file
+            object's ``name`` attribute, if any, is used for ``FILENAME``
+            (which ``hkeys`` may override).
 
         clobber : bool
             Overwrite existing file. Default is `True`.
@@ -2287,7 +2391,7 @@ class SpectralElement(Integrator):
         _precision = precision.lower()[0]
         pcodes = {'d':'D', 's':'E', 'f':'E'}
 
-        if clobber:
+        if clobber and isinstance(filename, str):
             try:
                 os.remove(filename)
             except OSError:
@@ -2335,7 +2439,11 @@ class SpectralElement(Integrator):
 
         # User-provided keys are written to the primary header;
         # so are filename and origin
-        bkeys = dict(filename=(os.path.basename(filename), 'name of file'),
+        if isinstance(filename, str):
+            basename = os.path.basename(filename)
+        else:
+            basename = os.path.basename(getattr(filename, 'name', ''))
+        bkeys = dict(filename=(basename, 'name of file'),
                      origin=('pysynphot', 'Version (%s, %s)' %
                              (__version__, __svn_revision__)))
         # User-values if present may override default values
@@ -2387,28 +2495,8 @@ class SpectralElement(Integrator):
             Resampled spectrum.
 
         """
-        # Check whether the input wavetab is in descending order
-        if resampledWaveTab[0] < resampledWaveTab[-1]:
-            newwave = resampledWaveTab
-            newasc = True
-        else:
-            newwave = resampledWaveTab[::-1]
-            newasc = False
-
-        # Use numpy interpolation function
-        if self._wavetable[0] < self._wavetable[-1]:
-            oldasc = True
-            ans = N.interp(newwave, self._wavetable, self._throughputtable)
-        else:
-            oldasc = False
-            rev = N.interp(newwave, self._wavetable[::-1],
-                           self._throughputtable[::-1])
-            ans = rev[::-1]
-
-        # If the new and old waveset don't have the same parity,
-        # the answer has to be flipped again
-        if (newasc != oldasc):
-            ans = ans[::-1]
+        ans = _interpTable(resampledWaveTab, self._wavetable,
+                           self._throughputtable)
 
         # Finally, make the new object.
         # NB: these manipulations were done using the internal
@@ -2600,7 +2688,7 @@ class CompositeSpectralElement(SpectralElement):
 
     def __call__(self, wavelength):
         """This is where the throughput calculation is delegated."""
-        return self.component1(wavelength) * self.component2(wavelength)
+        return _evaluateChain(self, wavelength, N.multiply)
 
     def __str__(self):
         return self.name
@@ -2833,8 +2921,8 @@ class TabularSpectralElement(SpectralElement):
 
         # pyfits cannot close the file on .close() if there are still
         # references to mmapped data
-        self._wavetable = fs[1].data.field('wavelength').copy()
-        self._throughputtable = fs[1].data.field(thrucol).copy()
+        self._wavetable = _nativeColumn(fs[1].data.field('wavelength'))
+        self._throughputtable = _nativeColumn(fs[1].data.field(thrucol))
 
         self.waveunits = units.Units(fs[1].header['tunit1'].lower())
         self.throughputunits = 'none'
@@ -2971,10 +3059,11 @@ class FileSpectralElement(TabularSpectralElement):
 
         # pyfits cannot close the file on .close() if there are still
         # references to mmapped data
-        self._wavetable = fs[1].data.field('wavelength').copy()
+        self._wavetable = _nativeColumn(fs[1].data.field('wavelength'))
         if throughputname is None:
             throughputname = 'throughput'
-        self._throughputtable = fs[1].data.field(throughputname).copy()
+        self._throughputtable = _nativeColumn(
+            fs[1].data.field(throughputname))
         self.waveunits = units.Units(fs[1].header['tunit1'].lower())
 
         # Retain the header information as a convenience for the user.
@@ -3085,7 +3174,7 @@ class InterpolatedSpectralElement(SpectralElement):
 
         # pyfits cannot close the file on .close() if there are still
         # references to mmapped data
-        wave0 = fs[1].data.field('wavelength').copy()
+        wave0 = _nativeColumn(fs[1].data.field('wavelength'))
 
         # Determine the columns that bracket the desired value
         # grab all columns that beging with the parameter name (e.g. 'MJD#')
@@ -3309,8 +3398,8 @@ class Box(SpectralElement):
                 thru = 0.0
         else:
             wave = N.asarray(wave)
-            thru = N.zeros(wave.shape, dtype=N.float64)
-            thru[(wave >= self.lower) & (wave <= self.upper)] = 1.0
+            thru = ((wave >= self.lower) &
+                    (wave <= self.upper)).astype(N.float64)
 
         return thru
 
@@ -3337,7 +3426,7 @@ class Box(SpectralElement):
         """
         return ArraySpectralElement(
             wave=resampledWaveTab.copy(), waveunits='angstrom',
-            throughput=self(resampledWaveTab).copy())
+            throughput=self(resampledWaveTab))
 
 
 Vega = FileSourceSpectrum(locations.VegaFile)
@@ -345,9 +345,15 @@ def scan(input):
     input = input.replace('%2b','+')
     return scanner.tokenize(input)
 
+_parser = None
+
 def parse(tokens):
-    parser = BaseParser(AST)
-    return parser.parse(tokens)
+    # The parser holds no per-parse state, so its grammar tables are
+    # built once and reused for every expression.
+    global _parser
+    if _parser is None:
+        _parser = BaseParser(AST)
+    return _parser.parse(tokens)
 
 def interpret(ast):
     interpreter = Interpreter(ast)
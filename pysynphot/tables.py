@@ -7,6 +7,8 @@ from __future__ import division, print_function
 import numpy as N
 from astropy.io import fits as pyfits
 
+from .locations import irafconvert
+
 #Flag to control verbosity
 DEBUG = False
 
@@ -27,6 +29,15 @@ class CompTable(object):
     compnames, filenames : array_like
         Values from ``COMPNAME`` and ``FILENAME`` columns in EXT 1.
 
+    compdict : dict
+        Maps each component name to its filename. If a name is
+        listed more than once, the first entry is used.
+
+    pathdict : dict
+        Maps component names to their filenames converted by
+        :func:`~pysynphot.locations.irafconvert`. Filled in by
+        :meth:`getpath` as components are looked up.
+
     Raises
     ------
     TypeError
@@ -44,14 +55,47 @@ class CompTable(object):
         self.compnames = cp[1].data.field('compname')
         self.filenames = cp[1].data.field('filename')
 
-        # Is this necessary?
-        compdict = {}
-        for i in range(len(self.compnames)):
-            compdict[self.compnames[i]] = self.filenames[i]
+        self.compdict = {}
+        for compname, filename in zip(self.compnames, self.filenames):
+            self.compdict.setdefault(compname, filename)
+        self.pathdict = {}
 
         cp.close()
         self.name=CFile
 
+    def getpath(self, compname):
+        """Return the Unix filename of the given component.
+
+        Parameters
+        ----------
+        compname : str
+            Component name.
+
+        Returns
+        -------
+        filename : str
+            Filename from ``compdict``, converted from IRAF format.
+
+        Raises
+        ------
+        IndexError
+            Component is not in the table.
+
+        """
+        try:
+            return self.pathdict[compname]
+        except KeyError:
+            pass
+
+        try:
+            iraffilename = self.compdict[compname]
+        except KeyError:
+            raise IndexError("Can't find %s in comptable %s"%(compname,self.name))
+
+        filename = irafconvert(iraffilename).lstrip()
+        self.pathdict[compname] = filename
+        return filename
+
 
 class GraphTable(object):
     """Class to handle a :ref:`graph table <pysynphot-graph>`.
@@ -7,7 +7,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_array_equal
 
-from .. import Cache
+from .. import Cache, refs
 from ..exceptions import ParameterOutOfBounds
 from ..catalog import Icat
 
@@ -109,6 +109,15 @@ class TestCatalogCache(object):
     def test_reset_catalog_cache(self):
         sp = Icat('k93models', 6440, 0, 4.3)  # noqa
         assert len(Cache.CATALOG_CACHE) != 0
+        assert len(Cache.BASIS_CACHE) != 0
 
         Cache.reset_catalog_cache()
         assert len(Cache.CATALOG_CACHE) == 0
+        assert len(Cache.BASIS_CACHE) == 0
+
+    def test_setref_clears_basis_cache(self):
+        sp = Icat('k93models', 6440, 0, 4.3)  # noqa
+        assert len(Cache.BASIS_CACHE) != 0
+
+        refs.setref(area=refs.PRIMARY_AREA)
+        assert len(Cache.BASIS_CACHE) == 0
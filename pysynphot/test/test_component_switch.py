@@ -8,10 +8,11 @@ from __future__ import absolute_import, division, print_function
 
 import os
 
+import numpy as np
 import pytest
 
 from .. import refs
-from ..observationmode import ObservationMode
+from ..observationmode import ObservationMode, _LRUCache
 
 
 @pytest.mark.remote_data
@@ -53,3 +54,47 @@ class TestCompSwitch(object):
                 missing.append(x)
 
         assert len(missing) == 0, 'missing: {}'.format(missing)
+
+
+@pytest.mark.remote_data
+def test_lookup_cache():
+    """Repeated look-ups are re-used until the reference tables are reset."""
+    obs = ObservationMode('acs,hrc,f435w')
+    key = (tuple(obs.modes), obs.gtname, obs.ctname)
+    assert key in refs.OBSMODEDICT
+
+    obs2 = ObservationMode('ACS,HRC,F435W')
+    assert obs2._throughput_filenames == obs._throughput_filenames
+    assert obs2.compnames == obs.compnames
+
+    refs.setref(area=refs.PRIMARY_AREA)
+    assert key not in refs.OBSMODEDICT
+
+
+@pytest.mark.remote_data
+def test_throughput_cache():
+    """Cached throughput products are not shared with the caller."""
+    bp1 = ObservationMode('acs,hrc,f435w').Throughput()
+    ref = bp1.throughput.copy()
+    bp1._throughputtable *= 2
+
+    bp2 = ObservationMode('acs,hrc,f435w').Throughput()
+    np.testing.assert_array_equal(bp2.throughput, ref)
+
+
+def test_lru_cache():
+    cache = _LRUCache(2)
+    cache['a'] = 1
+    cache['b'] = 2
+    cache['a']  # 'b' is now the least recently used
+    cache['c'] = 3
+    assert list(cache) == ['a', 'c']
+
+    new = cache.copy()
+    assert isinstance(new, _LRUCache)
+    assert new.maxsize == 2
+    assert list(new.items()) == [('a', 1), ('c', 3)]
+
+    new['d'] = 4
+    assert list(new) == ['c', 'd']
+    assert list(cache) == ['a', 'c']
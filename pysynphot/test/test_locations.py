@@ -1,12 +1,13 @@
 from __future__ import absolute_import, division, print_function
 
 import os
+import warnings
 
 import astropy
 from astropy.utils.data import get_pkg_data_filename
 from astropy.utils.introspection import minversion
 
-from .. import locations
+from .. import locations, refs
 
 ASTROPY_LT_4_3 = not minversion(astropy, '4.3')
 
@@ -53,3 +54,52 @@ def test_CONVERTDICT():
     locations.CONVERTDICT['testjref'] = os.path.dirname(refpath)
     filename = locations.irafconvert('testjref$empty_test_file.txt')
     assert refpath == filename
+
+
+def test_remote_listing_cache():
+    """
+    Test that a remote directory listing is reused by get_latest_file
+    instead of being requested again.
+    """
+    url = 'ftp://example.com/mtab'
+    locations._REMOTE_LISTINGS[url] = ['a_tmg.fits', 'b_tmg.fits',
+                                       'a_tmc.fits']
+    try:
+        assert (locations.get_latest_file(url + '/*_tmg.fits') ==
+                os.path.join(url, 'b_tmg.fits'))
+        assert (locations.get_latest_file(url + '/*_tmc.fits') ==
+                os.path.join(url, 'a_tmc.fits'))
+    finally:
+        del locations._REMOTE_LISTINGS[url]
+
+
+def test_remote_listing_reset(monkeypatch):
+    """
+    Test that resetting the reference data with setref() fetches
+    remote directory listings again.
+    """
+    url = 'ftp://example.com'
+    requested = []
+
+    class FakeResponse(object):
+        def read(self):
+            return b'-rw-r--r-- 1 a_tmg.fits\n-rw-r--r-- 1 a_tmc.fits\n'
+
+    def fake_urlopen(path):
+        requested.append(path)
+        return FakeResponse()
+
+    # Restored by monkeypatch after the test
+    for name in ('GRAPHTABLE', 'COMPTABLE', 'THERMTABLE'):
+        monkeypatch.setattr(refs, name, getattr(refs, name))
+    monkeypatch.setenv('PYSYN_CDBS', url)
+    monkeypatch.setattr(locations.request, 'urlopen', fake_urlopen)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')  # No thermal tables listed
+            refs.setref()
+            refs.setref()
+        assert requested == [url + '/mtab', url + '/mtab']
+        assert refs.GRAPHTABLE == url + '/mtab/a_tmg.fits'
+    finally:
+        locations._REMOTE_LISTINGS.clear()
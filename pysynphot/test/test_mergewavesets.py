@@ -31,6 +31,17 @@ def test_merge_wave_sets():
         'Deltas should be < {}, min delta = {}'.format(MERGETHRESH, delta.min())  # noqa
 
 
+def test_merge_identical_wave_sets():
+    """
+    Merging a wave set with an equal copy of itself should give the same
+    answer as the general union, including removal of close values.
+    """
+    wave = np.array([3000, 1000, 2000, 2000, 2000 + MERGETHRESH / 10])
+    expected = MergeWaveSets(wave, np.concatenate([wave, wave]))
+    np.testing.assert_array_equal(MergeWaveSets(wave, wave.copy()), expected)
+    np.testing.assert_array_equal(expected, [1000, 2000, 3000])
+
+
 @pytest.mark.remote_data
 class TestQSOCountrate(object):
     """
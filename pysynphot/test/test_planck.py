@@ -0,0 +1,19 @@
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose
+
+from .. import planck
+
+
+@pytest.mark.parametrize('temperature', [10, 290, 5000, 1.0E5])
+def test_bb_photlam_arcsec_scalar(temperature):
+    """Scalar input gives a scalar that matches the array evaluation."""
+    wave = np.logspace(1, 7, 50)
+    result = planck.bb_photlam_arcsec(wave, temperature)
+
+    for w, r in zip(wave, result):
+        value = planck.bb_photlam_arcsec(w, temperature)
+        assert np.ndim(value) == 0
+        assert_allclose(value, r, rtol=1e-14)
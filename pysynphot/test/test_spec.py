@@ -7,8 +7,10 @@ import pytest
 from astropy.utils.data import get_pkg_data_filename
 from numpy.testing import assert_array_equal
 
-from ..spectrum import (ArraySourceSpectrum, BlackBody, FileSourceSpectrum,
-                        FlatSpectrum, GaussianSource, Powerlaw)
+from .. import exceptions
+from ..spectrum import (ArraySourceSpectrum, BlackBody, Box,
+                        FileSourceSpectrum, FlatSpectrum, GaussianSource,
+                        Powerlaw)
 from ..units import WaveUnits, FluxUnits
 
 
@@ -19,6 +21,40 @@ def test_fits_header():
     assert sp.fheader['TARGETID'] == 'ALPHA_LYR'
 
 
+@pytest.mark.parametrize('step', [1, -1])
+def test_call_matches_resample(step):
+    """Evaluating a tabular spectrum matches resampling it."""
+    sp = ArraySourceSpectrum(wave=np.arange(1000., 2000., 10)[::step],
+                             flux=np.linspace(1, 2, 100))
+    wave = np.arange(1005., 1995., 3)
+    assert_array_equal(sp(wave), sp.resample(wave)._fluxtable)
+    assert_array_equal(sp(wave[::-1]), sp.resample(wave[::-1])._fluxtable)
+
+    with pytest.raises(exceptions.DuplicateWavelength):
+        sp(np.array([1100., 1200., 1200.]))
+
+
+def test_chained_sum():
+    """A chain of added spectra evaluates like the nested sums."""
+    bbs = [BlackBody(t) for t in (3000, 5000, 7000, 9000)]
+    sp = bbs[0] + bbs[1] + bbs[2] + bbs[3]
+    wave = np.logspace(3, 4, 50)
+    expected = ((bbs[0](wave) + bbs[1](wave)) + bbs[2](wave)) + bbs[3](wave)
+    assert_array_equal(sp(wave), expected)
+
+
+def test_chained_product():
+    """A chain of multiplied bandpasses evaluates like the nested products."""
+    bps = [Box(c, 2000) for c in (4000, 4500, 5000)]
+    bp = bps[0] * bps[1] * bps[2] * 0.5
+    wave = np.arange(3000., 6000., 10)
+    expected = ((bps[0](wave) * bps[1](wave)) * bps[2](wave)) * 0.5
+    assert_array_equal(bp(wave), expected)
+
+    sp = BlackBody(5000) * bp
+    assert_array_equal(sp(wave), BlackBody(5000)(wave) * expected)
+
+
 class BaseSpec(object):
     """Base class for source spectrum tests."""
 
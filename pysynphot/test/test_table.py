@@ -7,10 +7,13 @@ from __future__ import absolute_import, division, print_function
 
 import numpy as np
 import pytest
+from astropy.io import fits
 
 from ..exceptions import (BadRow, DuplicateWavelength, UnsortedWavelength,
                           ZeroWavelength)
+from ..locations import irafconvert
 from ..spectrum import ArraySourceSpectrum, FileSourceSpectrum
+from ..tables import CompTable
 
 
 def test_wave_exceptions():
@@ -45,3 +48,26 @@ def test_file_badrow(tmpdir):
     with pytest.raises(BadRow) as e:
         FileSourceSpectrum(str(fname))
         assert e.rows == 3
+
+
+def test_comptable_compdict(tmpdir):
+    cols = [fits.Column(name='COMPNAME', format='10A',
+                        array=['acs_a', 'acs_b', 'acs_a']),
+            fits.Column(name='FILENAME', format='30A',
+                        array=['crcomp$a_001.fits', 'crcomp$b_001.fits',
+                               'crcomp$a_002.fits'])]
+    fname = str(tmpdir.join('test_tmc.fits'))
+    fits.BinTableHDU.from_columns(cols).writeto(fname)
+
+    ct = CompTable(fname)
+
+    # First entry wins for duplicate names
+    assert ct.compdict == {'acs_a': 'crcomp$a_001.fits',
+                           'acs_b': 'crcomp$b_001.fits'}
+
+    # Converted paths are cached per component
+    assert ct.getpath('acs_b') == irafconvert('crcomp$b_001.fits')
+    assert ct.pathdict == {'acs_b': irafconvert('crcomp$b_001.fits')}
+
+    with pytest.raises(IndexError):
+        ct.getpath('acs_c')
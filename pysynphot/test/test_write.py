@@ -1,5 +1,6 @@
 from __future__ import absolute_import, division, print_function
 
+import io
 import os
 
 import numpy as np
@@ -29,6 +30,18 @@ def test_write(tmpdir, obj):
     obj.writefits(str(fname))
 
 
+@pytest.mark.parametrize(
+    'obj', [BlackBody(10000), Box(7000, 13.5)])
+def test_write_fileobj(tmpdir, obj):
+    """Writing to a file object gives the same file as writing by name."""
+    fname = tmpdir.join('out.fits')
+    obj.writefits(str(fname))
+    buf = io.BytesIO()
+    obj.writefits(buf, hkeys={'filename': ('out.fits', 'name of file')})
+    with open(str(fname), 'rb') as f:
+        assert f.read() == buf.getvalue()
+
+
 @pytest.mark.remote_data
 class TestWriteParse(object):
     """
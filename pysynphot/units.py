@@ -909,8 +909,7 @@ class Photlam(FluxUnits):
 
         """
         from . import spectrum
-        resampled = spectrum.Vega.resample(wave)
-        normalized = flux / resampled._fluxtable
+        normalized = flux / spectrum.Vega(wave)
         return -2.5 * N.log10(normalized)
 
     def ToCounts(self, wave, flux, area=None):
@@ -1927,8 +1926,12 @@ class VegaMag(LogFluxUnits):
             Converted values.
 
         """
-        resampled = self.vegaspec.resample(wave)
-        return resampled.flux * 10.0**(-0.4 * flux)
+        # Vega flux at the given wavelengths in its own flux unit, as
+        # self.vegaspec.resample(wave).flux would give, without building
+        # the resampled spectrum.
+        vegaflux = Photlam().Convert(wave, self.vegaspec(wave),
+                                     self.vegaspec.fluxunits.name)
+        return vegaflux * 10.0**(-0.4 * flux)
 
     def unitResponse(self,band):
         """This is used internally for :ref:`pysynphot-formula-effstim`
@@ -2007,39 +2010,40 @@ class Counts(FluxUnits):
 
 
 ################   Factory for Units subclasses.   #####################
-def factory(uname, *args, **kwargs):
-    unitsClasses = {'flam'      : Flam,
-                    'fnu'       : Fnu,
-                    'photlam'   : Photlam,
-                    'photnu'    : Photnu,
-                    'jy'        : Jy,
-                    'mjy'       : mJy,
-                    'mujy'      : muJy,
-                    'microjy'   : muJy,
-                    'ujy'       : muJy,
-                    'njy'       : nJy,
-                    'nanojy'    : nJy,
-                    'abmag'     : ABMag,
-                    'stmag'     : STMag,
-                    'obmag'     : OBMag,
-                    'vegamag'   : VegaMag,
-                    'counts'    : Counts,
-                    'count'     : Counts,
-                    'angstrom'  : Angstrom,
-                    'angstroms' : Angstrom,
-                    'nm'        : Nm,
-                    'micron'    : Micron,
-                    'microns'   : Micron,
-                    'um'        : Micron,
-                    'inversemicron': InverseMicron,
-                    'inversemicrons': InverseMicron,
-                    '1/um'      : InverseMicron,
-                    'mm'        : Mm,
-                    'cm'        : Cm,
-                    'm'         : Meter,
-                    'meter'     : Meter,
-                    'hz'        : Hz}
+_UNITS_CLASSES = {'flam'      : Flam,
+                  'fnu'       : Fnu,
+                  'photlam'   : Photlam,
+                  'photnu'    : Photnu,
+                  'jy'        : Jy,
+                  'mjy'       : mJy,
+                  'mujy'      : muJy,
+                  'microjy'   : muJy,
+                  'ujy'       : muJy,
+                  'njy'       : nJy,
+                  'nanojy'    : nJy,
+                  'abmag'     : ABMag,
+                  'stmag'     : STMag,
+                  'obmag'     : OBMag,
+                  'vegamag'   : VegaMag,
+                  'counts'    : Counts,
+                  'count'     : Counts,
+                  'angstrom'  : Angstrom,
+                  'angstroms' : Angstrom,
+                  'nm'        : Nm,
+                  'micron'    : Micron,
+                  'microns'   : Micron,
+                  'um'        : Micron,
+                  'inversemicron': InverseMicron,
+                  'inversemicrons': InverseMicron,
+                  '1/um'      : InverseMicron,
+                  'mm'        : Mm,
+                  'cm'        : Cm,
+                  'm'         : Meter,
+                  'meter'     : Meter,
+                  'hz'        : Hz}
+
 
+def factory(uname, *args, **kwargs):
     key=uname.lower()
-    ans= unitsClasses[key]()
+    ans= _UNITS_CLASSES[key]()
     return ans